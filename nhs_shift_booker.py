@@ -8,8 +8,12 @@ This script automates shift booking on the NHS Professionals platform using Sele
 It continuously searches for available shifts and books them automatically.
 """
 
+import hashlib
+import os
+import queue
 import time
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -17,7 +21,17 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.keys import Keys
+from selenium.common.exceptions import (
+    TimeoutException, NoSuchElementException, StaleElementReferenceException,
+    WebDriverException
+)
 from webdriver_manager.chrome import ChromeDriverManager
+
+try:
+    import lxml.html as lxml_html
+except ImportError:
+    lxml_html = None
+
 from config import (
     NHS_EMAIL, NHS_PASSWORD, PREFERRED_LOCATION, PREFERRED_SHIFT_TYPES,
     SHIFT_TIME_START, SHIFT_TIME_END, MAX_SHIFTS_TO_BOOK,
@@ -25,6 +39,59 @@ from config import (
     RETRY_DELAY_SECONDS, ELEMENT_WAIT_TIME
 )
 
+# CSS selector matching a shift card in any of the layouts NHSP has used
+SHIFT_ITEM_CSS = "div[class*='shift-item'], div[class*='shift-card'], tr[class*='shift'], li[class*='shift']"
+
+# Runs in-browser and returns every shift's fields in a single round-trip,
+# instead of one WebDriver command per field per shift
+SHIFT_EXTRACT_JS = """
+var items = document.querySelectorAll(arguments[0]);
+var pick = function(el, selectors) {
+    for (var i = 0; i < selectors.length; i++) {
+        var child = el.querySelector(selectors[i]);
+        if (child && child.textContent.trim()) { return child.textContent.trim(); }
+    }
+    return 'Unknown';
+};
+var out = [];
+for (var i = 0; i < items.length; i++) {
+    var el = items[i];
+    var pay = pick(el, ['[class*="pay"]']);
+    if (pay === 'Unknown') {
+        var m = (el.innerText || '').match(/£\\s?\\d[\\d.,]*/);
+        if (m) { pay = m[0]; }
+    }
+    out.push({
+        'index': i,
+        'title': pick(el, ['[class*="job-title"]', '[class*="title"]', 'h3']),
+        'location': pick(el, ['[class*="location"]']),
+        'date': pick(el, ['[class*="shift-date"]', '[class*="date"]']),
+        'time': pick(el, ['[class*="shift-time"]', '[class*="time"]']),
+        'pay': pay
+    });
+}
+return out;
+"""
+
+# Scrolls a shift card into view and clicks its book/apply control in a
+# single round-trip; returns false so the caller can fall back to the
+# locator-based click path
+BOOK_CLICK_JS = """
+return (function(el) {
+    el.scrollIntoView({behavior: 'instant', block: 'center'});
+    var b = el.querySelector("button[class*='book'], a[class*='book'], button[class*='apply']");
+    if (!b) {
+        var candidates = el.querySelectorAll('button, a');
+        for (var i = 0; i < candidates.length; i++) {
+            var t = (candidates[i].textContent || '').trim().toLowerCase();
+            if (t.indexOf('book') !== -1 || t.indexOf('apply') !== -1) { b = candidates[i]; break; }
+        }
+    }
+    if (b) { b.click(); return true; }
+    return false;
+})(arguments[0]);
+"""
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -36,8 +103,97 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Extra logged-in sessions used to book several shifts at once
+BOOKING_POOL_SIZE = 2
+
+# Where the resolved chromedriver path is remembered between runs
+CHROMEDRIVER_CACHE = os.path.expanduser("~/.cache/nhs_bot/chromedriver_path")
+CHROMEDRIVER_MAX_AGE_DAYS = 7
+
+
+def _cached_or_install():
+    """
+    Resolve the chromedriver binary without hitting the network every start
+
+    ChromeDriverManager().install() checks online for a newer driver each
+    call, adding seconds to startup and failing offline. Remember the
+    resolved path and only re-install when the cache is missing, older
+    than CHROMEDRIVER_MAX_AGE_DAYS, or points at a deleted binary.
+
+    Returns:
+        str: Path to the chromedriver binary
+    """
+    try:
+        if os.path.exists(CHROMEDRIVER_CACHE):
+            age = time.time() - os.path.getmtime(CHROMEDRIVER_CACHE)
+            if age < CHROMEDRIVER_MAX_AGE_DAYS * 86400:
+                with open(CHROMEDRIVER_CACHE) as f:
+                    cached_path = f.read().strip()
+                if cached_path and os.path.exists(cached_path):
+                    return cached_path
+    except OSError as e:
+        logger.debug("Could not read chromedriver cache: %s", e)
+
+    driver_path = ChromeDriverManager().install()
+    try:
+        os.makedirs(os.path.dirname(CHROMEDRIVER_CACHE), exist_ok=True)
+        with open(CHROMEDRIVER_CACHE, 'w') as f:
+            f.write(driver_path)
+    except OSError as e:
+        logger.debug("Could not write chromedriver cache: %s", e)
+    return driver_path
+
 
 class NHSShiftBooker:
+    # Locator candidates as (By, selector) tuples, tried in order on a
+    # selector-cache miss. Built once at class definition instead of on
+    # every call in the polling loop; the selector cache makes the winning
+    # entry effectively index 0 on later calls.
+    LOGIN_BUTTON_LOCATORS = (
+        (By.XPATH, "//a[contains(text(), 'Log in')]"),
+        (By.XPATH, "//button[contains(text(), 'Log in')]"),
+    )
+    EMAIL_FIELD_LOCATORS = (
+        (By.CSS_SELECTOR, "input#username, input[name='email'], input[type='email']"),
+    )
+    PASSWORD_FIELD_LOCATORS = (
+        (By.CSS_SELECTOR, "input#password, input[name='password'], input[type='password']"),
+    )
+    SUBMIT_BUTTON_LOCATORS = (
+        (By.CSS_SELECTOR, "button#kc-login, button[type*='submit'], input[value='Log in']"),
+    )
+    SHIFTS_LINK_LOCATORS = (
+        (By.XPATH, "//a[contains(text(), 'Find work')]"),
+        (By.XPATH, "//a[contains(text(), 'Shifts')]"),
+        (By.XPATH, "//a[contains(text(), 'Available shifts')]"),
+        (By.XPATH, "//nav//a[contains(text(), 'Work')]"),
+    )
+    LOCATION_FIELD_LOCATORS = (
+        (By.CSS_SELECTOR, "input[placeholder*='location'], input[placeholder*='Location'], input[name='location']"),
+    )
+    TYPE_FIELD_LOCATORS = (
+        (By.CSS_SELECTOR, "input[placeholder*='type'], select[name='shiftType']"),
+    )
+    SEARCH_BUTTON_LOCATORS = (
+        (By.XPATH, "//button[contains(text(), 'Search')]"),
+        (By.XPATH, "//button[contains(text(), 'search')]"),
+        (By.CSS_SELECTOR, "button[type='submit']"),
+    )
+    BOOK_BUTTON_LOCATORS = (
+        (By.CSS_SELECTOR, "button[class*='book']"),
+        (By.XPATH, ".//button[contains(text(), 'Book')]"),
+        (By.XPATH, ".//a[contains(text(), 'Apply')]"),
+        (By.XPATH, ".//button[contains(text(), 'Apply')]"),
+    )
+    CONFIRM_BUTTON_LOCATORS = (
+        (By.XPATH, "//button[contains(text(), 'Confirm')]"),
+        (By.XPATH, "//button[contains(text(), 'Yes')]"),
+        (By.CSS_SELECTOR, "button.btn-primary"),
+    )
+
+    # How long a processed shift stays in the dedup set before it may be retried
+    SEEN_SHIFT_TTL_SECONDS = 24 * 60 * 60
+
     def __init__(self, email, password, headless=False):
         """
         Initialize the NHS Shift Booker
@@ -52,12 +208,23 @@ class NHSShiftBooker:
         self.headless = headless
         self.driver = None
         self.wait = None
+        self._short_wait = None
         self.booked_shifts = []
-        
+        self._selector_cache = {}
+        self._search_url = None
+        self._empty_streak = 0
+        self._last_dom_hash = None
+        self._seen_shift_ids = {}
+        self._driver_pool = None
+        self._pool_workers = []
+
     def setup_driver(self):
         """Initialize the Chrome WebDriver"""
         try:
             options = webdriver.ChromeOptions()
+            # Return from driver.get at DOMContentLoaded instead of waiting
+            # for third-party trackers to finish loading
+            options.page_load_strategy = 'eager'
             if self.headless:
                 options.add_argument('--headless')
             options.add_argument('--no-sandbox')
@@ -67,130 +234,314 @@ class NHSShiftBooker:
             options.add_argument('user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36')
             options.add_experimental_option("excludeSwitches", ["enable-automation"])
             options.add_experimental_option('useAutomationExtension', False)
+            # Images and notifications have no bearing on shift booking but
+            # dominate page weight - skip them to speed up every page load
+            options.add_experimental_option("prefs", {
+                "profile.managed_default_content_settings.images": 2,
+                "profile.default_content_setting_values.notifications": 2
+            })
+            options.add_argument('--blink-settings=imagesEnabled=false')
             
-            service = Service(ChromeDriverManager().install())
-            self.driver = webdriver.Chrome(service=service, options=options)
+            driver_path = os.environ.get("CHROMEDRIVER_PATH") or _cached_or_install()
+            service = Service(driver_path)
+            # keep_alive reuses one HTTP connection to chromedriver instead of
+            # opening a fresh TCP connection for every WebDriver command
+            self.driver = webdriver.Chrome(service=service, options=options, keep_alive=True)
             self.wait = WebDriverWait(self.driver, ELEMENT_WAIT_TIME)
+            # For probes where absence is a normal outcome, so they don't
+            # block the full ELEMENT_WAIT_TIME before giving up
+            self._short_wait = WebDriverWait(self.driver, 2)
             logger.info("✅ WebDriver initialized successfully")
         except Exception as e:
             logger.error(f"❌ Failed to initialize WebDriver: {e}")
             raise
 
-    def login(self, retry_count=0):
-        """Login to NHS Professionals with retry logic"""
-        try:
-            logger.info("🔐 Starting login process...")
-            self.driver.get("https://www.nhsprofessionals.nhs.uk/")
-            time.sleep(3)
-            
-            # Look for login button
+    def _poll(self, predicate, timeout, interval=0.1):
+        """
+        Poll a predicate at fine granularity, returning as soon as it holds
+
+        Args:
+            predicate: Zero-argument callable returning truthy when ready
+            timeout (float): Maximum seconds to keep polling
+            interval (float): Seconds between polls
+
+        Returns:
+            bool: True if the predicate held within the timeout
+        """
+        deadline = time.time() + timeout
+        while time.time() < deadline:
             try:
-                login_button = self.wait.until(
-                    EC.element_to_be_clickable((By.XPATH, "//a[contains(text(), 'Log in')] | //button[contains(text(), 'Log in')]"))
-                )
-                login_button.click()
-                logger.info("✓ Clicked login button")
-                time.sleep(2)
-            except:
-                logger.warning("Login button not found, might already be on login page")
-            
-            # Switch to login frame if exists
+                if predicate():
+                    return True
+            except Exception:
+                pass
+            time.sleep(interval)
+        return False
+
+    def _page_ready(self, timeout=None):
+        """Wait until the DOM is parseable instead of sleeping a fixed interval
+
+        'interactive' is enough: with the eager page load strategy the
+        document may never be observed as 'complete' within the timeout.
+        """
+        return self._poll(
+            lambda: self.driver.execute_script("return document.readyState") != "loading",
+            ELEMENT_WAIT_TIME if timeout is None else timeout
+        )
+
+    def _find_cached(self, field, candidates, condition=EC.presence_of_element_located, wait=None):
+        """
+        Locate an element, remembering which selector worked last time
+
+        The NHSP page layout is stable across search cycles, so once a
+        candidate locator has matched we try it first on later calls (with
+        a short timeout) instead of burning a full wait on every failing
+        alternative.
+
+        Args:
+            field (str): Logical name for the element ("login_button", ...)
+            candidates (list): (By, selector) locator tuples to try in order
+            condition: Expected condition to wait with
+            wait: WebDriverWait to use on cache miss (defaults to self.wait;
+                pass self._short_wait for elements that may simply be absent)
+
+        Returns:
+            WebElement: The located element
+        """
+        if wait is None:
+            wait = self.wait
+
+        cached = self._selector_cache.get(field)
+        if cached:
             try:
-                iframes = self.driver.find_elements(By.TAG_NAME, "iframe")
-                if iframes:
-                    self.driver.switch_to.frame(iframes[0])
-                    logger.info("✓ Switched to login iframe")
-                    time.sleep(1)
-            except Exception as e:
-                logger.debug(f"No iframe found: {e}")
-            
-            # Enter email
+                return self._short_wait.until(condition(cached))
+            except TimeoutException:
+                logger.debug("Cached selector for '%s' stale, re-discovering", field)
+                self._selector_cache.pop(field, None)
+
+        last_error = None
+        for locator in candidates:
             try:
-                email_field = self.wait.until(
-                    EC.presence_of_element_located((By.XPATH, "//input[@id='username'] | //input[@name='email'] | //input[@type='email']"))
-                )
-                email_field.clear()
-                email_field.send_keys(self.email)
-                logger.info("✓ Email entered")
-                time.sleep(1)
-            except Exception as e:
-                logger.error(f"❌ Failed to find email field: {e}")
-                if retry_count < MAX_RETRY_ATTEMPTS:
-                    logger.info(f"Retrying login... Attempt {retry_count + 1}")
-                    time.sleep(RETRY_DELAY_SECONDS)
-                    self.driver.refresh()
-                    return self.login(retry_count + 1)
-                raise
-            
-            # Enter password
+                element = wait.until(condition(locator))
+                self._selector_cache[field] = locator
+                return element
+            except (TimeoutException, WebDriverException) as e:
+                last_error = e
+                continue
+        raise last_error
+
+    def _find_in_shift(self, field, shift, candidates):
+        """
+        Find a child element inside a shift card, caching the winning selector
+
+        Args:
+            field (str): Logical name for the field ("book_button", ...)
+            shift: Parent WebElement to search within
+            candidates (list): Relative (By, selector) locator tuples to try in order
+
+        Returns:
+            WebElement or None: The child element, or None if no selector matched
+        """
+        cached = self._selector_cache.get(field)
+        if cached:
             try:
-                password_field = self.wait.until(
-                    EC.presence_of_element_located((By.XPATH, "//input[@id='password'] | //input[@name='password'] | //input[@type='password']"))
-                )
-                password_field.clear()
-                password_field.send_keys(self.password)
-                logger.info("✓ Password entered")
-                time.sleep(1)
-            except Exception as e:
-                logger.error(f"❌ Failed to find password field: {e}")
-                raise
-            
-            # Click login button
+                return shift.find_element(*cached)
+            except (NoSuchElementException, StaleElementReferenceException):
+                self._selector_cache.pop(field, None)
+
+        for locator in candidates:
             try:
-                submit_button = self.wait.until(
-                    EC.element_to_be_clickable((By.XPATH, "//button[@id='kc-login'] | //button[contains(@type, 'submit')] | //input[@value='Log in']"))
+                element = shift.find_element(*locator)
+                self._selector_cache[field] = locator
+                return element
+            except (NoSuchElementException, StaleElementReferenceException):
+                continue
+        return None
+
+    def _shifts_fingerprint(self):
+        """
+        Cheap SHA-1 fingerprint of the shift listing's visible text
+
+        Lets the main loop skip the whole extract-and-book pass when the
+        page content is identical to the previous cycle.
+
+        Returns:
+            str or None: Hex digest, or None if the text could not be read
+        """
+        try:
+            text = self.driver.execute_script(
+                "return Array.from(document.querySelectorAll(arguments[0]))"
+                ".map(function(e){ return e.innerText; }).join('\\n');",
+                SHIFT_ITEM_CSS
+            )
+            return hashlib.sha1((text or '').encode('utf-8')).hexdigest()
+        except Exception as e:
+            logger.debug("Could not fingerprint shift listing: %s", e)
+            return None
+
+    def _shift_id(self, shift_info):
+        """
+        Stable short hash identifying a shift across cycles
+
+        Args:
+            shift_info (dict): Extracted shift details
+
+        Returns:
+            str: Hex digest over title, date, time and location
+        """
+        key = "|".join((
+            shift_info.get('title', 'Unknown'),
+            shift_info.get('date', 'Unknown'),
+            shift_info.get('time', 'Unknown'),
+            shift_info.get('location', 'Unknown'),
+        ))
+        return hashlib.blake2b(key.encode('utf-8'), digest_size=8).hexdigest()
+
+    def _prune_seen_shifts(self):
+        """Drop dedup entries older than the TTL so those shifts can be retried"""
+        cutoff = time.time() - self.SEEN_SHIFT_TTL_SECONDS
+        self._seen_shift_ids = {
+            sid: ts for sid, ts in self._seen_shift_ids.items() if ts >= cutoff
+        }
+
+    def _session_expired(self):
+        """Check whether the current page has bounced back to a login form"""
+        try:
+            return bool(
+                self.driver.find_elements(By.CSS_SELECTOR, "input[type='password']")
+                or self.driver.find_elements(
+                    By.XPATH, "//*[contains(text(), 'Session expired')] | //*[contains(text(), 'session has expired')]"
                 )
-                submit_button.click()
-                logger.info("✓ Login submitted")
-                time.sleep(5)
-            except Exception as e:
-                logger.error(f"❌ Failed to find submit button: {e}")
-                raise
-            
-            # Check if login was successful
-            try:
-                self.driver.switch_to.default_content()
-            except:
-                pass
-            
-            time.sleep(3)
-            logger.info("✅ Login successful")
-            
+            )
+        except WebDriverException:
+            return False
+
+    def _open_login_page(self):
+        """Open the NHSP site and get onto the login form"""
+        self.driver.get("https://www.nhsprofessionals.nhs.uk/")
+        self._page_ready()
+
+        # Look for login button
+        try:
+            # Optional probe: absence just means we're already on the form
+            login_button = self._find_cached(
+                "login_button", self.LOGIN_BUTTON_LOCATORS,
+                condition=EC.element_to_be_clickable,
+                wait=self._short_wait
+            )
+            login_button.click()
+            logger.info("✓ Clicked login button")
+            # Login form may render inline or inside an iframe
+            self._poll(
+                lambda: self.driver.find_elements(By.CSS_SELECTOR, "input#username, input[type='email']")
+                or self.driver.find_elements(By.TAG_NAME, "iframe"),
+                ELEMENT_WAIT_TIME
+            )
+        except TimeoutException:
+            logger.warning("Login button not found, might already be on login page")
+
+        # Switch to login frame if exists
+        try:
+            iframes = self.driver.find_elements(By.TAG_NAME, "iframe")
+            if iframes:
+                self.driver.switch_to.frame(iframes[0])
+                logger.info("✓ Switched to login iframe")
         except Exception as e:
-            logger.error(f"❌ Login failed: {e}")
-            raise
+            logger.debug("No iframe found: %s", e)
+
+    def _fill_credentials(self):
+        """Enter email and password into the login form"""
+        email_field = self._find_cached("email_field", self.EMAIL_FIELD_LOCATORS)
+        email_field.clear()
+        email_field.send_keys(self.email)
+        logger.info("✓ Email entered")
+
+        password_field = self._find_cached("password_field", self.PASSWORD_FIELD_LOCATORS)
+        password_field.clear()
+        password_field.send_keys(self.password)
+        logger.info("✓ Password entered")
+
+    def _submit_login(self):
+        """Submit the login form and wait out the redirect"""
+        submit_button = self._find_cached(
+            "submit_button", self.SUBMIT_BUTTON_LOCATORS,
+            condition=EC.element_to_be_clickable
+        )
+        url_before_submit = self.driver.current_url
+        submit_button.click()
+        logger.info("✓ Login submitted")
+        try:
+            self.wait.until(EC.url_changes(url_before_submit))
+        except TimeoutException:
+            logger.debug("URL did not change after login submit")
+
+        # Check if login was successful
+        try:
+            self.driver.switch_to.default_content()
+        except WebDriverException:
+            pass
+        self._page_ready()
+
+    def login(self):
+        """
+        Login to NHS Professionals with retry logic
+
+        Retries iteratively rather than recursing, so a failure only
+        re-runs the phases that have not yet succeeded and the stack does
+        not grow with the attempt count.
+        """
+        logger.info("🔐 Starting login process...")
+        last_error = None
+        on_login_form = False
+
+        for attempt in range(MAX_RETRY_ATTEMPTS + 1):
+            if attempt:
+                logger.info(f"Retrying login... Attempt {attempt}/{MAX_RETRY_ATTEMPTS}")
+                time.sleep(RETRY_DELAY_SECONDS)
+            try:
+                if not on_login_form:
+                    self._open_login_page()
+                    on_login_form = True
+                self._fill_credentials()
+                self._submit_login()
+                logger.info("✅ Login successful")
+                return
+            except Exception as e:
+                last_error = e
+                logger.error(f"❌ Login attempt failed: {e}")
+                # A refresh may bounce us off the form, so re-open next time
+                on_login_form = False
+                try:
+                    self.driver.refresh()
+                    self._page_ready()
+                except Exception:
+                    pass
+
+        logger.error(f"❌ Login failed: {last_error}")
+        raise last_error
 
     def navigate_to_shifts(self):
         """Navigate to available shifts"""
         try:
             logger.info("🔍 Navigating to available shifts...")
             
-            # Try multiple ways to find shifts/find work link
-            xpath_options = [
-                "//a[contains(text(), 'Find work')]",
-                "//a[contains(text(), 'Shifts')]",
-                "//a[contains(text(), 'Available shifts')]",
-                "//nav//a[contains(text(), 'Work')"]
-            ]
-            
             found = False
-            for xpath in xpath_options:
-                try:
-                    shifts_link = self.wait.until(
-                        EC.element_to_be_clickable((By.XPATH, xpath))
-                    )
-                    shifts_link.click()
-                    found = True
-                    logger.info("✓ Found and clicked shifts link")
-                    break
-                except:
-                    continue
-            
+            try:
+                shifts_link = self._find_cached(
+                    "shifts_link", self.SHIFTS_LINK_LOCATORS,
+                    condition=EC.element_to_be_clickable
+                )
+                shifts_link.click()
+                found = True
+                logger.info("✓ Found and clicked shifts link")
+            except (TimeoutException, StaleElementReferenceException, WebDriverException):
+                pass
+
             if not found:
                 logger.warning("⚠️ Could not find shifts link, trying direct URL")
                 self.driver.get("https://www.nhsprofessionals.nhs.uk/search-shifts")
-            
-            time.sleep(3)
+
+            self._page_ready()
             logger.info("✅ Navigated to shifts section")
             
         except Exception as e:
@@ -198,8 +549,9 @@ class NHSShiftBooker:
             raise
 
     def search_shifts(self, location=None, shift_type=None):
-        """Search for available shifts with filters"""
-        
+        """
+        Search for available shifts with filters
+
         Args:
             location (str): Location/area
             shift_type (str): Type of shift
@@ -210,12 +562,9 @@ class NHSShiftBooker:
             # Try to find and fill location field
             if location:
                 try:
-                    location_field = self.wait.until(
-                        EC.presence_of_element_located((By.XPATH, "//input[contains(@placeholder, 'location')] | //input[contains(@placeholder, 'Location')] | //input[@name='location']"))
-                    )
+                    location_field = self._find_cached("location_field", self.LOCATION_FIELD_LOCATORS)
                     location_field.clear()
                     location_field.send_keys(location)
-                    time.sleep(1)
                     logger.info(f"✓ Entered location: {location}")
                 except Exception as e:
                     logger.warning(f"⚠️ Could not enter location: {e}")
@@ -223,205 +572,342 @@ class NHSShiftBooker:
             # Try to find and fill shift type field
             if shift_type:
                 try:
-                    type_field = self.wait.until(
-                        EC.presence_of_element_located((By.XPATH, "//input[contains(@placeholder, 'type')] | //select[@name='shiftType']"))
-                    )
+                    type_field = self._find_cached("type_field", self.TYPE_FIELD_LOCATORS)
                     type_field.clear()
                     type_field.send_keys(shift_type)
-                    time.sleep(1)
                     logger.info(f"✓ Entered shift type: {shift_type}")
                 except Exception as e:
                     logger.warning(f"⚠️ Could not enter shift type: {e}")
             
             # Click search button
+            results_rendered = False
             try:
-                search_button = self.wait.until(
-                    EC.element_to_be_clickable((By.XPATH, "//button[contains(text(), 'Search')] | //button[contains(text(), 'search')] | //button[@type='submit']"))
+                search_button = self._find_cached(
+                    "search_button", self.SEARCH_BUTTON_LOCATORS,
+                    condition=EC.element_to_be_clickable
                 )
                 search_button.click()
                 logger.info("✓ Search submitted")
-                time.sleep(4)
+                # Wait for either results or an explicit empty state, not a fixed delay
+                no_results_xpath = "//*[contains(text(), 'No shifts') or contains(text(), 'no shifts') or contains(text(), 'No results')]"
+                results_rendered = self._poll(
+                    lambda: self.driver.find_elements(By.CSS_SELECTOR, SHIFT_ITEM_CSS)
+                    or self.driver.find_elements(By.XPATH, no_results_xpath),
+                    ELEMENT_WAIT_TIME
+                )
             except Exception as e:
                 logger.warning(f"⚠️ Could not find search button: {e}")
-            
+
+            # Remember the results URL (filters included) so later cycles can
+            # reload it directly instead of re-navigating and re-typing filters.
+            # Only cache a page that verifiably showed results (or an explicit
+            # empty state) - caching a half-failed search would pin every later
+            # cycle to a dead page with no recovery path.
+            if results_rendered:
+                self._search_url = self.driver.current_url
+            else:
+                self._search_url = None
             logger.info("✅ Shift search completed")
-            
+
         except Exception as e:
             logger.error(f"❌ Shift search failed: {e}")
 
     def get_available_shifts(self):
-        """Get list of available shifts matching criteria"""
-        
+        """
+        Get list of available shifts matching criteria
+
         Returns:
             list: List of shift details
         """
         try:
-            shifts = []
-            
-            # Try multiple selector patterns for shift items
-            selectors = [
-                "//div[contains(@class, 'shift-item')] | //div[contains(@class, 'shift-card')]",
-                "//tr[contains(@class, 'shift')]",
-                "//li[contains(@class, 'shift')]"
-            ]
-            
-            shift_elements = []
-            for selector in selectors:
-                try:
-                    shift_elements = self.driver.find_elements(By.XPATH, selector)
-                    if shift_elements:
-                        break
-                except:
-                    continue
-            
-            logger.info(f"🔎 Found {len(shift_elements)} shift elements")
-            
-            for idx, shift in enumerate(shift_elements):
-                try:
-                    # Extract shift details
-                    shift_info = {
-                        'index': idx,
-                        'element': shift
-                    }
-                    
-                    # Try to get job title
-                    try:
-                        title = shift.find_element(By.XPATH, ".//*[contains(@class, 'title')] | ./h3 | .//*[contains(@class, 'job-title')] ").text
-                        shift_info['title'] = title
-                    except:
-                        shift_info['title'] = 'Unknown'
-                    
-                    # Try to get location
-                    try:
-                        location = shift.find_element(By.XPATH, ".//*[contains(@class, 'location')] | .//*[contains(text(), 'worcester')] ").text
-                        shift_info['location'] = location
-                    except:
-                        shift_info['location'] = 'Unknown'
-                    
-                    # Try to get date
-                    try:
-                        date = shift.find_element(By.XPATH, ".//*[contains(@class, 'date')] | .//*[contains(@class, 'shift-date')] ").text
-                        shift_info['date'] = date
-                    except:
-                        shift_info['date'] = 'Unknown'
-                    
-                    # Try to get time
-                    try:
-                        time_text = shift.find_element(By.XPATH, ".//*[contains(@class, 'time')] | .//*[contains(@class, 'shift-time')] ").text
-                        shift_info['time'] = time_text
-                    except:
-                        shift_info['time'] = 'Unknown'
-                    
-                    # Try to get pay
-                    try:
-                        pay = shift.find_element(By.XPATH, ".//*[contains(@class, 'pay')] | .//*[contains(text(), '£')] ").text
-                        shift_info['pay'] = pay
-                    except:
-                        shift_info['pay'] = 'Unknown'
-                    
-                    shifts.append(shift_info)
-                    logger.debug(f"Shift {idx}: {shift_info.get('title', 'Unknown')} - {shift_info.get('date', 'Unknown')}")
-                    
-                except Exception as e:
-                    logger.debug(f"Could not parse shift {idx}: {e}")
-                    continue
-            
-            logger.info(f"✅ Found {len(shifts)} available shifts")
+            # Single in-browser pass: all shifts, all fields, one round-trip,
+            # instead of one WebDriver command per field per shift
+            shifts = self.driver.execute_script(SHIFT_EXTRACT_JS, SHIFT_ITEM_CSS) or []
+
+            # Cards present but no field selector matched anything: re-parse
+            # their raw HTML locally before giving up on the cycle
+            if shifts and all(
+                s.get('title') == 'Unknown' and s.get('date') == 'Unknown' for s in shifts
+            ):
+                parsed = self._extract_shifts_from_html()
+                if parsed:
+                    logger.debug("Using lxml fallback extraction for shift fields")
+                    shifts = parsed
+
+            if logger.isEnabledFor(logging.DEBUG):
+                for shift_info in shifts:
+                    logger.debug("Shift %s: %s - %s", shift_info['index'],
+                                 shift_info.get('title', 'Unknown'), shift_info.get('date', 'Unknown'))
+
+            logger.info("✅ Found %d available shifts", len(shifts))
             return shifts
-            
+
         except Exception as e:
             logger.error(f"❌ Failed to get available shifts: {e}")
             return []
 
-    def book_shift(self, shift_details, retry_count=0):
-        """Book a specific shift with retry logic"""
-        
-        Args:
-            shift_details (dict): Shift details dictionary
-            retry_count (int): Current retry attempt
-            
+    def _extract_shifts_from_html(self):
+        """
+        Fallback extraction: one round-trip for the cards' outerHTML, then
+        parse the fields in-process with lxml
+
+        Used when the in-page extraction finds cards but none of its
+        selectors match any fields (e.g. after a markup change).
+
         Returns:
-            bool: True if booking successful, False otherwise
+            list: List of shift details, or [] if lxml is unavailable
         """
+        if lxml_html is None:
+            logger.debug("lxml not installed, skipping HTML fallback extraction")
+            return []
+
         try:
-            shift_title = shift_details.get('title', 'Unknown')
-            shift_date = shift_details.get('date', 'Unknown')
-            logger.info(f"📅 Attempting to book shift: {shift_title} on {shift_date}")
-            
-            # Scroll to shift element
-            self.driver.execute_script("arguments[0].scrollIntoView(true);");
-            time.sleep(1)
-            
-            # Find and click book/apply button
+            blobs = self.driver.execute_script(
+                "return Array.from(document.querySelectorAll(arguments[0]))"
+                ".map(function(e){ return e.outerHTML; });",
+                SHIFT_ITEM_CSS
+            ) or []
+        except Exception as e:
+            logger.debug("Could not fetch shift HTML: %s", e)
+            return []
+
+        shifts = []
+        for idx, blob in enumerate(blobs):
             try:
-                book_button = shift_details['element'].find_element(
-                    By.XPATH, 
-                    ".//button[contains(text(), 'Book')] | .//a[contains(text(), 'Apply')] | .//button[contains(text(), 'Apply')] | .//button[contains(@class, 'book')]"
-                )
-                book_button.click()
-                logger.info("✓ Clicked book/apply button")
-                time.sleep(2)
+                tree = lxml_html.fromstring(blob)
+                shift_info = {
+                    'index': idx,
+                    'title': self._first_text(tree, [".//*[contains(@class, 'job-title')]", ".//*[contains(@class, 'title')]", ".//h3"]),
+                    'location': self._first_text(tree, [".//*[contains(@class, 'location')]"]),
+                    'date': self._first_text(tree, [".//*[contains(@class, 'shift-date')]", ".//*[contains(@class, 'date')]"]),
+                    'time': self._first_text(tree, [".//*[contains(@class, 'shift-time')]", ".//*[contains(@class, 'time')]"]),
+                    'pay': self._first_text(tree, [".//*[contains(@class, 'pay')]", ".//*[contains(text(), '£')]"]),
+                }
+                shifts.append(shift_info)
             except Exception as e:
-                logger.warning(f"⚠️ Could not find book button: {e}")
-                if retry_count < MAX_RETRY_ATTEMPTS:
-                    logger.info("Retrying...")
-                    time.sleep(RETRY_DELAY_SECONDS)
-                    return self.book_shift(shift_details, retry_count + 1)
+                logger.debug("Could not parse shift %d: %s", idx, e)
+                continue
+        return shifts
+
+    @staticmethod
+    def _first_text(tree, xpaths):
+        """Return the first non-empty text content matching any of the XPaths"""
+        for xpath in xpaths:
+            nodes = tree.xpath(xpath)
+            if nodes:
+                text = nodes[0].text_content().strip()
+                if text:
+                    return text
+        return 'Unknown'
+
+    def _resolve_shift_element(self, shift_details):
+        """
+        Re-locate the WebElement for a shift extracted by get_available_shifts
+
+        The extraction pass returns plain dicts (no element handles), so the
+        actual element is only resolved here when a click is needed. The
+        listing may have mutated since extraction (a card removed, a pooled
+        worker seeing a different order), so the card at the same index is
+        only trusted if its text still matches the extracted shift -
+        clicking an unverified index could book the wrong shift.
+
+        Args:
+            shift_details (dict): Shift details including 'index'
+
+        Returns:
+            WebElement or None: The matching shift card, or None if it is gone
+        """
+        index = shift_details.get('index', -1)
+        try:
+            elements = self.driver.find_elements(By.CSS_SELECTOR, SHIFT_ITEM_CSS)
+            if 0 <= index < len(elements):
+                element = elements[index]
+                if self._matches_shift(element, shift_details):
+                    return element
+                logger.debug("Card at index %d no longer matches extracted shift", index)
+        except WebDriverException as e:
+            logger.debug("Could not resolve shift element %d: %s", index, e)
+        return None
+
+    @staticmethod
+    def _matches_shift(element, shift_details):
+        """Check that a card's text still contains the extracted title and date"""
+        try:
+            text = element.text or ''
+        except WebDriverException:
+            return False
+        for field in ('title', 'date'):
+            value = shift_details.get(field, 'Unknown')
+            if value != 'Unknown' and value not in text:
                 return False
-            
-            # Handle confirmation dialog if present
-            try:
-                confirm_button = self.wait.until(
-                    EC.element_to_be_clickable((By.XPATH, "//button[contains(text(), 'Confirm')] | //button[contains(text(), 'Yes')] | //button[@class='btn-primary']"))
-                )
-                confirm_button.click()
-                logger.info("✓ Confirmed booking")
-                time.sleep(2)
-            except:
-                logger.debug("No confirmation dialog found")
-            
-            # Check for success message
+        return True
+
+    def book_shift(self, shift_details):
+        """
+        Book a specific shift with retry logic
+
+        Retries iteratively with early return on success, keeping total
+        retry wall time bounded by MAX_RETRY_ATTEMPTS.
+
+        Args:
+            shift_details (dict): Shift details dictionary
+
+        Returns:
+            bool: True if booking successful, False otherwise
+        """
+        shift_title = shift_details.get('title', 'Unknown')
+        shift_date = shift_details.get('date', 'Unknown')
+
+        for attempt in range(MAX_RETRY_ATTEMPTS + 1):
+            if attempt:
+                logger.info(f"Retrying... Attempt {attempt}/{MAX_RETRY_ATTEMPTS}")
+                time.sleep(RETRY_DELAY_SECONDS)
             try:
-                success_indicators = [
-                    "//*[contains(text(), 'successfully')]",
-                    "//*[contains(text(), 'booked')]",
-                    "//*[contains(text(), 'confirmed')]",
-                    "//*[contains(text(), 'Application successful')]"
-                ]
-                
-                for indicator in success_indicators:
-                    try:
-                        success_msg = self.driver.find_element(By.XPATH, indicator)
-                        logger.info(f"✅ Shift booked successfully: {success_msg.text}")
-                        self.booked_shifts.append({
-                            'title': shift_title,
-                            'date': shift_date,
-                            'time': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                        })
-                        return True
-                    except:
+                logger.info("📅 Attempting to book shift: %s on %s", shift_title, shift_date)
+
+                shift_element = self._resolve_shift_element(shift_details)
+                if shift_element is None:
+                    logger.warning("⚠️ Shift element not found on current page")
+                    # Booking an earlier shift may have navigated off the
+                    # listing - reload it and let the retry loop have another
+                    # go, rather than returning a failure for a shift that
+                    # was never actually attempted
+                    if self._search_url:
+                        self.driver.get(self._search_url)
+                        self._page_ready()
+                    continue
+
+                # Scroll and click in one in-browser call instead of separate
+                # scroll / locate / click round-trips
+                clicked = self.driver.execute_script(BOOK_CLICK_JS, shift_element)
+                if not clicked:
+                    book_button = self._find_in_shift("book_button", shift_element, self.BOOK_BUTTON_LOCATORS)
+                    if book_button is None:
+                        logger.warning("⚠️ Could not find book button")
                         continue
-                
-                # If no explicit success message, assume success after 2 seconds
-                logger.info(f"✅ Shift booking processed for: {shift_title}")
-                self.booked_shifts.append({
-                    'title': shift_title,
-                    'date': shift_date,
-                    'time': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                })
-                return True
-                
+                    book_button.click()
+                logger.info("✓ Clicked book/apply button")
+
+                # Handle confirmation dialog if present; its absence is normal,
+                # so don't block the full ELEMENT_WAIT_TIME on it
+                try:
+                    confirm_button = self._find_cached(
+                        "confirm_button", self.CONFIRM_BUTTON_LOCATORS,
+                        condition=EC.element_to_be_clickable,
+                        wait=self._short_wait
+                    )
+                    confirm_button.click()
+                    logger.info("✓ Confirmed booking")
+                    self._page_ready()
+                except TimeoutException:
+                    logger.debug("No confirmation dialog found")
+
+                # Check for success message
+                try:
+                    success_indicators = [
+                        "//*[contains(text(), 'successfully')]",
+                        "//*[contains(text(), 'booked')]",
+                        "//*[contains(text(), 'confirmed')]",
+                        "//*[contains(text(), 'Application successful')]"
+                    ]
+
+                    # find_elements raises nothing when absent - cheaper than
+                    # catching NoSuchElementException per probe
+                    for indicator in success_indicators:
+                        matches = self.driver.find_elements(By.XPATH, indicator)
+                        if matches:
+                            logger.info("✅ Shift booked successfully: %s", matches[0].text)
+                            self.booked_shifts.append({
+                                'title': shift_title,
+                                'date': shift_date,
+                                'time': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+                            })
+                            return True
+
+                    # If no explicit success message, assume success
+                    logger.info(f"✅ Shift booking processed for: {shift_title}")
+                    self.booked_shifts.append({
+                        'title': shift_title,
+                        'date': shift_date,
+                        'time': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+                    })
+                    return True
+
+                except Exception as e:
+                    logger.warning(f"⚠️ Could not verify booking status: {e}")
+                    return False
+
             except Exception as e:
-                logger.warning(f"⚠️ Could not verify booking status: {e}")
+                logger.error(f"❌ Failed to book shift: {e}")
+                continue
+
+        return False
+
+    def _init_driver_pool(self):
+        """
+        Lazily spin up BOOKING_POOL_SIZE extra logged-in sessions
+
+        Each worker is its own NHSShiftBooker with its own driver, held in
+        a queue so one session is only ever used by one thread at a time.
+
+        Returns:
+            bool: True if at least one pooled session is available
+        """
+        if self._driver_pool is None:
+            pool = queue.Queue()
+            for _ in range(BOOKING_POOL_SIZE):
+                try:
+                    worker = NHSShiftBooker(self.email, self.password, headless=self.headless)
+                    worker.setup_driver()
+                    worker.login()
+                    self._pool_workers.append(worker)
+                    pool.put(worker)
+                except Exception as e:
+                    logger.warning("⚠️ Could not start pooled session: %s", e)
+            if pool.empty():
+                # Leave the pool unset so a later cycle can try to build it
+                # again once whatever broke startup (e.g. a login outage)
+                # has cleared, instead of disabling the parallel path for
+                # the life of the process
+                logger.warning("⚠️ No pooled sessions could be started, will retry next batch")
                 return False
-                
+            self._driver_pool = pool
+        return not self._driver_pool.empty()
+
+    def _book_with_pooled_driver(self, shift):
+        """
+        Book one shift on a pooled, pre-logged-in session
+
+        Args:
+            shift (dict): Shift details from get_available_shifts
+
+        Returns:
+            bool: True if booking successful
+        """
+        worker = self._driver_pool.get()
+        try:
+            worker.driver.get(self._search_url)
+            worker._page_ready()
+            # Pooled sessions idle between batches and hit NHSP's session
+            # timeout just like the main driver - mirror the main loop's
+            # expired-session recovery before booking
+            if worker._session_expired():
+                logger.warning("⚠️ Pooled session expired, logging in again")
+                worker.login()
+                worker.driver.get(self._search_url)
+                worker._page_ready()
+            # book_shift's element-not-found recovery reloads the worker's
+            # own _search_url, so hand it ours or that path is dead here
+            worker._search_url = self._search_url
+            booked = worker.book_shift(shift)
+            if booked:
+                self.booked_shifts.append(worker.booked_shifts[-1])
+            return booked
         except Exception as e:
-            logger.error(f"❌ Failed to book shift: {e}")
-            if retry_count < MAX_RETRY_ATTEMPTS:
-                logger.info(f"Retrying... Attempt {retry_count + 1}/{MAX_RETRY_ATTEMPTS}")
-                time.sleep(RETRY_DELAY_SECONDS)
-                return self.book_shift(shift_details, retry_count + 1)
+            logger.error("❌ Pooled booking failed: %s", e)
             return False
+        finally:
+            self._driver_pool.put(worker)
 
     def run_continuous_booking(self):
         """Continuously search and book shifts 24/7"""
@@ -441,52 +927,108 @@ class NHSShiftBooker:
             
             while True:
                 search_cycle += 1
-                logger.info(f"\n{'='*60}")
-                logger.info(f"🔄 SEARCH CYCLE #{search_cycle} - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-                logger.info(f"{'='*60}")
+                logger.info("\n" + "=" * 60)
+                logger.info("🔄 SEARCH CYCLE #%d - %s", search_cycle, datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
+                logger.info("=" * 60)
                 
                 try:
-                    self.navigate_to_shifts()
-                    self.search_shifts(
-                        location=PREFERRED_LOCATION,
-                        shift_type=PREFERRED_SHIFT_TYPES[0] if PREFERRED_SHIFT_TYPES else None
-                    )
-                    
-                    shifts = self.get_available_shifts()
-                    
-                    if not shifts:
-                        logger.info("ℹ️  No available shifts found. Waiting for next search...")
+                    if self._search_url:
+                        # Session reuse: reload the saved results URL instead of
+                        # re-walking navigation and re-typing the filters
+                        logger.info("↻ Reloading cached search URL")
+                        self.driver.get(self._search_url)
+                        self._page_ready()
+                        if self._session_expired():
+                            logger.warning("⚠️ Session expired, logging in again")
+                            self._search_url = None
+                            self.login()
+
+                    if not self._search_url:
+                        self.navigate_to_shifts()
+                        self.search_shifts(
+                            location=PREFERRED_LOCATION,
+                            shift_type=PREFERRED_SHIFT_TYPES[0] if PREFERRED_SHIFT_TYPES else None
+                        )
+
+                    # Fingerprint gate: identical listing text means there is
+                    # nothing new to extract or book this cycle
+                    listing_hash = self._shifts_fingerprint()
+                    if listing_hash is not None and listing_hash == self._last_dom_hash:
+                        logger.info("ℹ️  Shift listing unchanged since last cycle, skipping extraction")
+                        self._empty_streak += 1
+                        shifts = []
                     else:
-                        logger.info(f"📊 Booked {len(self.booked_shifts)} shifts so far")
-                        
-                        for shift in shifts:
-                            logger.info(f"\n→ Processing: {shift.get('title', 'Unknown')}")
-                            logger.info(f"  Date: {shift.get('date', 'Unknown')}")
-                            logger.info(f"  Time: {shift.get('time', 'Unknown')}")
-                            logger.info(f"  Location: {shift.get('location', 'Unknown')}")
-                            
-                            if self.book_shift(shift):
-                                logger.info(f"✅ Successfully booked!")
+                        self._last_dom_hash = listing_hash
+                        shifts = self.get_available_shifts()
+
+                        if not shifts:
+                            self._empty_streak += 1
+                            logger.info("ℹ️  No available shifts found. Waiting for next search...")
+                        else:
+                            self._empty_streak = 0
+                            self._prune_seen_shifts()
+                            logger.info("📊 Booked %d shifts so far", len(self.booked_shifts))
+
+                            new_shifts = []
+                            for shift in shifts:
+                                sid = self._shift_id(shift)
+                                if sid in self._seen_shift_ids:
+                                    logger.debug("Skipping already-processed shift %s", sid)
+                                    continue
+                                new_shifts.append((sid, shift))
+
+                            if len(new_shifts) > 1 and self._search_url and self._init_driver_pool():
+                                # Several shifts at once: book them in parallel
+                                # on the pooled sessions to win the race
+                                logger.info("🚀 Booking %d shifts in parallel", len(new_shifts))
+                                with ThreadPoolExecutor(max_workers=BOOKING_POOL_SIZE) as executor:
+                                    results = list(executor.map(
+                                        self._book_with_pooled_driver,
+                                        [shift for _, shift in new_shifts]
+                                    ))
+                                for (sid, shift), booked in zip(new_shifts, results):
+                                    if booked:
+                                        logger.info("✅ Successfully booked: %s", shift.get('title', 'Unknown'))
+                                    else:
+                                        logger.warning("⚠️  Booking failed: %s, won't reattempt for 24h", shift.get('title', 'Unknown'))
+                                    self._seen_shift_ids[sid] = time.time()
                             else:
-                                logger.warning(f"⚠️  Booking failed, will retry next cycle")
-                            
-                            time.sleep(2)
+                                for sid, shift in new_shifts:
+                                    logger.info("\n→ Processing: %s", shift.get('title', 'Unknown'))
+                                    logger.info("  Date: %s", shift.get('date', 'Unknown'))
+                                    logger.info("  Time: %s", shift.get('time', 'Unknown'))
+                                    logger.info("  Location: %s", shift.get('location', 'Unknown'))
+
+                                    if self.book_shift(shift):
+                                        logger.info("✅ Successfully booked!")
+                                    else:
+                                        logger.warning("⚠️  Booking failed, won't reattempt for 24h")
+
+                                    # Booked or out of retries - either way, don't
+                                    # re-walk this shift every cycle
+                                    self._seen_shift_ids[sid] = time.time()
+
+                                    time.sleep(2)
                     
                     # Log booking statistics
-                    logger.info(f"\n📈 BOOKING STATISTICS:")
-                    logger.info(f"   Total shifts booked: {len(self.booked_shifts)}")
+                    logger.info("\n📈 BOOKING STATISTICS:")
+                    logger.info("   Total shifts booked: %d", len(self.booked_shifts))
                     if self.booked_shifts:
                         for booking in self.booked_shifts:
-                            logger.info(f"   ✓ {booking['title']} on {booking['date']}")
+                            logger.info("   ✓ %s on %s", booking['title'], booking['date'])
                     
                 except Exception as e:
-                    logger.error(f"❌ Error during search cycle: {e}")
+                    logger.error("❌ Error during search cycle: %s", e)
+                    # Force full navigation next cycle in case the cached URL went bad
+                    self._search_url = None
                     logger.info("Continuing to next cycle...")
                 
-                # Wait before next search
-                logger.info(f"\n⏳ Waiting {SEARCH_INTERVAL_MINUTES} minutes before next search...")
-                logger.info(f"⏰ Next search at: {datetime.now().strftime('%H:%M:%S')}")
-                time.sleep(SEARCH_INTERVAL_MINUTES * 60)
+                # Exponential backoff: poll again quickly after an active cycle,
+                # back off towards SEARCH_INTERVAL_MINUTES during dry spells
+                sleep_seconds = min(SEARCH_INTERVAL_MINUTES * 60, 30 * (2 ** min(self._empty_streak, 6)))
+                logger.info("\n⏳ Waiting %d seconds before next search...", sleep_seconds)
+                logger.info("⏰ Current time: %s", datetime.now().strftime('%H:%M:%S'))
+                time.sleep(sleep_seconds)
                 
         except KeyboardInterrupt:
             logger.info("\n\n🛑 Stopping shift booker (Ctrl+C pressed)")
@@ -494,15 +1036,21 @@ class NHSShiftBooker:
             for booking in self.booked_shifts:
                 logger.info(f"   ✓ {booking['title']} on {booking['date']}")
         except Exception as e:
+            # Let main() restart with a fresh object once this driver is closed
             logger.error(f"❌ Fatal error: {e}")
-            logger.error("Attempting to restart...")
-            time.sleep(10)
-            self.run_continuous_booking()
+            raise
         finally:
             self.close()
 
     def close(self):
-        """Close the WebDriver"""
+        """Close the WebDriver and any pooled sessions"""
+        for worker in self._pool_workers:
+            try:
+                worker.close()
+            except Exception:
+                pass
+        self._pool_workers = []
+        self._driver_pool = None
         if self.driver:
             self.driver.quit()
             logger.info("🔚 WebDriver closed")
@@ -513,8 +1061,19 @@ def main():
     logger.info("Starting NHS Professionals Shift Booker...")
     logger.info(f"Configuration loaded for: {NHS_EMAIL}")
     
-    booker = NHSShiftBooker(NHS_EMAIL, NHS_PASSWORD, headless=HEADLESS_MODE)
-    booker.run_continuous_booking()
+    # Restart loop: each recovery gets a fresh booker whose previous driver
+    # has been closed, instead of recursing inside run_continuous_booking
+    # and stacking leaked sessions
+    while True:
+        booker = NHSShiftBooker(NHS_EMAIL, NHS_PASSWORD, headless=HEADLESS_MODE)
+        try:
+            booker.run_continuous_booking()
+            break
+        except KeyboardInterrupt:
+            break
+        except Exception:
+            logger.error("Restarting with a fresh session in 10 seconds...")
+            time.sleep(10)
 
 
 if __name__ == "__main__":
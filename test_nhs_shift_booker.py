@@ -0,0 +1,22 @@
+"""
+Sanity check that the booker module at least parses.
+
+Importing it outright needs selenium and a local config.py, so this only
+compiles the source - enough to catch the SyntaxErrors that have
+previously shipped in this file.
+"""
+
+import py_compile
+import unittest
+from pathlib import Path
+
+MODULE_PATH = Path(__file__).with_name("nhs_shift_booker.py")
+
+
+class TestModuleParses(unittest.TestCase):
+    def test_module_compiles(self):
+        py_compile.compile(str(MODULE_PATH), doraise=True)
+
+
+if __name__ == "__main__":
+    unittest.main()